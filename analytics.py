@@ -5,6 +5,7 @@ import pandas as pd
 import plotly.express as px
 import plotly.utils
 import json
+from sqlalchemy.orm import contains_eager, raiseload
 from main import db, Booking, User, Workplace
 
 analytics_bp = Blueprint('analytics', __name__)
@@ -12,7 +13,11 @@ analytics_bp = Blueprint('analytics', __name__)
 
 def get_booking_stats(start_date=None, end_date=None):
     """Получение статистики по бронированиям"""
-    query = Booking.query.join(User).join(Workplace)
+    query = Booking.query.join(User).join(Workplace).options(
+        contains_eager(Booking.user),
+        contains_eager(Booking.workplace),
+        raiseload('*')
+    )
 
     if start_date:
         query = query.filter(Booking.start_time >= start_date)
@@ -0,0 +1,113 @@
+"""Статические бандлы с хэшем содержимого в имени и сжатие ответов.
+
+Исходники лежат в static/css и static/js. Для каждого файла в static/dist создается копия
+с первыми 10 символами sha256 в имени (base.css -> base.1a2b3c4d5e.css) и заранее сжатые
+варианты .gz и .br. Имя меняется вместе с содержимым, поэтому бандлы можно отдавать
+с кэшированием на год: повторные заходы загружают только HTML.
+"""
+import gzip
+import hashlib
+import os
+import shutil
+import threading
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Сжимаются только текстовые ответы не меньше этого размера
+COMPRESS_MIN_SIZE = 500
+COMPRESSIBLE_MIMETYPES = {
+    'text/html', 'text/css', 'text/plain', 'text/csv', 'text/calendar',
+    'application/json', 'application/javascript', 'image/svg+xml',
+}
+BUNDLE_DIRS = ('css', 'js')
+
+
+def fingerprinted_name(path: str, content: bytes) -> str:
+    root, ext = os.path.splitext(path)
+    return f"{root}.{hashlib.sha256(content).hexdigest()[:10]}{ext}"
+
+
+class AssetManifest:
+    """Соответствие исходных путей (js/dashboard.js) и путей бандлов в dist.
+
+    Бандл пересобирается, только если изменилось время модификации исходника,
+    поэтому в рабочем режиме после первого обращения это просто поиск в словаре.
+    """
+
+    def __init__(self, static_folder: str, dist_dir: str = 'dist'):
+        self.static_folder = static_folder
+        self.dist_folder = os.path.join(static_folder, dist_dir)
+        self._entries = {}  # путь -> (mtime исходника, путь бандла относительно dist)
+        self._lock = threading.Lock()
+
+    def resolve(self, path: str) -> str:
+        source = os.path.join(self.static_folder, path)
+        mtime = os.stat(source).st_mtime
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == mtime:
+                return entry[1]
+
+        with open(source, 'rb') as f:
+            content = f.read()
+        bundle = fingerprinted_name(path, content)
+        self.write_bundle(bundle, content)
+        with self._lock:
+            self._entries[path] = (mtime, bundle)
+        return bundle
+
+    def write_bundle(self, bundle: str, content: bytes):
+        target = os.path.join(self.dist_folder, bundle)
+        if os.path.exists(target):
+            return
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+        # Сначала сжатые варианты, затем сам бандл: по его наличию судим, что сборка завершена
+        with gzip.open(target + '.gz.tmp', 'wb', compresslevel=9) as f:
+            f.write(content)
+        os.replace(target + '.gz.tmp', target + '.gz')
+        if brotli is not None:
+            with open(target + '.br.tmp', 'wb') as f:
+                f.write(brotli.compress(content, quality=11))
+            os.replace(target + '.br.tmp', target + '.br')
+        with open(target + '.tmp', 'wb') as f:
+            f.write(content)
+        os.replace(target + '.tmp', target)
+
+    def build(self, clean: bool = False) -> list:
+        """Собирает все бандлы из static/css и static/js, возвращает пары (исходник, бандл)"""
+        if clean and os.path.isdir(self.dist_folder):
+            shutil.rmtree(self.dist_folder)
+            with self._lock:
+                self._entries.clear()
+
+        built = []
+        for bundle_dir in BUNDLE_DIRS:
+            source_dir = os.path.join(self.static_folder, bundle_dir)
+            if not os.path.isdir(source_dir):
+                continue
+            for file_name in sorted(os.listdir(source_dir)):
+                path = f"{bundle_dir}/{file_name}"
+                if os.path.isfile(os.path.join(self.static_folder, path)):
+                    built.append((path, self.resolve(path)))
+        return built
+
+
+def accepted_encoding(accept_encoding: str):
+    """Лучшее поддерживаемое сжатие из заголовка Accept-Encoding: 'br', 'gzip' или None"""
+    encodings = {part.split(';')[0].strip().lower() for part in accept_encoding.split(',')}
+    if brotli is not None and 'br' in encodings:
+        return 'br'
+    if 'gzip' in encodings:
+        return 'gzip'
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        # Умеренное качество: сжатие идет на каждый ответ
+        return brotli.compress(data, quality=5)
+    return gzip.compress(data, compresslevel=6)
@@ -0,0 +1,341 @@
+"""Кэш, общий для всех процессов приложения.
+
+Бэкенды:
+    memory://                 - LRU в памяти процесса (для разработки и тестов)
+    sqlite:////path/cache.db  - общий файл для всех воркеров на одном сервере
+    redis://host:6379/0       - общий кэш для нескольких серверов (нужен пакет redis)
+
+Ключи группируются в пространства имен (CacheNamespace). Инвалидация - через версии:
+версия области (например, локации или дня) входит в ключ, и после ее увеличения старые
+записи просто перестают запрашиваться и удаляются по TTL или вытеснением.
+"""
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+
+class MemoryCache:
+    """LRU-кэш в памяти процесса с TTL"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: list) -> dict:
+        now = time.time()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                value, expires_at = entry
+                if expires_at is not None and expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = value
+        return found
+
+    def set(self, key: str, value, ttl: int = None):
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl if ttl else None)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_versions(self, keys: list) -> dict:
+        with self._lock:
+            return {key: self._versions.get(key, 0) for key in keys}
+
+    def incr_versions(self, keys: list):
+        with self._lock:
+            for key in keys:
+                self._versions[key] = self._versions.get(key, 0) + 1
+
+    def after_fork(self):
+        # Процесс получил копию записей родителя, она остается корректной
+        pass
+
+
+class SQLiteCache:
+    """Кэш в общем SQLite-файле: видят все процессы на сервере, работает без отдельного сервиса"""
+
+    # Раз в столько записей удаляются истекшие ключи
+    PURGE_EVERY = 500
+    # Ограничение SQLite на число параметров в одном запросе
+    MAX_PARAMS = 500
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        self._writes = 0
+        with self._connection() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)')
+            connection.execute('CREATE TABLE IF NOT EXISTS versions (key TEXT PRIMARY KEY, version INTEGER NOT NULL)')
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            # WAL: читатели не блокируют писателя из другого воркера
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _select(self, sql: str, keys: list, *params) -> list:
+        rows = []
+        for i in range(0, len(keys), self.MAX_PARAMS):
+            chunk = keys[i:i + self.MAX_PARAMS]
+            rows.extend(self._connection().execute(sql.format(placeholders=', '.join('?' * len(chunk))),
+                                                   [*chunk, *params]).fetchall())
+        return rows
+
+    def get_many(self, keys: list) -> dict:
+        rows = self._select('SELECT key, value FROM cache WHERE key IN ({placeholders}) '
+                            'AND (expires_at IS NULL OR expires_at > ?)', keys, time.time())
+        return {key: pickle.loads(value) for key, value in rows}
+
+    def set(self, key: str, value, ttl: int = None):
+        connection = self._connection()
+        connection.execute(
+            'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+            (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), time.time() + ttl if ttl else None)
+        )
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            connection.execute('DELETE FROM cache WHERE expires_at <= ?', (time.time(),))
+
+    def delete(self, key: str):
+        self._connection().execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def get_versions(self, keys: list) -> dict:
+        rows = dict(self._select('SELECT key, version FROM versions WHERE key IN ({placeholders})', keys))
+        return {key: rows.get(key, 0) for key in keys}
+
+    def incr_versions(self, keys: list):
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.executemany(
+                'INSERT INTO versions (key, version) VALUES (?, 1) '
+                'ON CONFLICT (key) DO UPDATE SET version = version + 1',
+                [(key,) for key in keys]
+            )
+            connection.execute('COMMIT')
+        except sqlite3.Error:
+            connection.execute('ROLLBACK')
+            raise
+
+    def after_fork(self):
+        # Соединение SQLite, открытое до fork, нельзя использовать в дочернем процессе
+        self._local = threading.local()
+
+
+class RedisCache:
+    """Кэш в Redis: общий для воркеров на разных серверах"""
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('Для CACHE_URL=redis://... нужен пакет redis')
+        self._redis = redis.Redis.from_url(url)
+
+    def get_many(self, keys: list) -> dict:
+        if not keys:
+            return {}
+        values = self._redis.mget(keys)
+        return {key: pickle.loads(value) for key, value in zip(keys, values) if value is not None}
+
+    def set(self, key: str, value, ttl: int = None):
+        self._redis.set(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ex=ttl)
+
+    def delete(self, key: str):
+        self._redis.delete(key)
+
+    def get_versions(self, keys: list) -> dict:
+        if not keys:
+            return {}
+        values = self._redis.mget(keys)
+        return {key: int(value) if value is not None else 0 for key, value in zip(keys, values)}
+
+    def incr_versions(self, keys: list):
+        pipeline = self._redis.pipeline()
+        for key in keys:
+            pipeline.incr(key)
+        pipeline.execute()
+
+    def after_fork(self):
+        self._redis.connection_pool.reset()
+
+
+def create_cache_backend(url: str, max_entries: int = 1024):
+    """Бэкенд по адресу из конфигурации CACHE_URL"""
+    parsed = urlparse(url)
+    if parsed.scheme == 'memory':
+        return MemoryCache(max_entries)
+    if parsed.scheme == 'sqlite':
+        # sqlite:////abs/path.db -> /abs/path.db, sqlite:///rel.db -> rel.db
+        return SQLiteCache(url[len('sqlite:///'):])
+    if parsed.scheme in ('redis', 'rediss', 'unix'):
+        return RedisCache(url)
+    raise ValueError(f'Неизвестный бэкенд кэша: {url}')
+
+
+class CacheNamespace:
+    """Пространство имен кэша с TTL по умолчанию и версиями областей.
+
+    Ключ записи строится из имени пространства, переданного ключа и версий областей,
+    от которых зависит значение. bump(scopes) делает недоступными все записи этих областей
+    сразу во всех процессах.
+    """
+
+    def __init__(self, backend, prefix: str, name: str, ttl: int = None):
+        self.backend = backend
+        self.prefix = f"{prefix}:{name}"
+        self.ttl = ttl
+
+    def _version_key(self, scope) -> str:
+        return f"{self.prefix}:version:{scope}"
+
+    def versions(self, scopes) -> tuple:
+        """Текущие версии областей (в том же порядке)"""
+        scopes = list(scopes)
+        keys = [self._version_key(scope) for scope in scopes]
+        versions = self.backend.get_versions(keys)
+        return tuple(versions[key] for key in keys)
+
+    def bump(self, scopes):
+        scopes = list(scopes)
+        if scopes:
+            self.backend.incr_versions([self._version_key(scope) for scope in scopes])
+
+    def _key(self, key) -> str:
+        # repr стабилен для кортежей из строк, чисел и дат, хэш ограничивает длину ключа
+        return f"{self.prefix}:{hashlib.sha1(repr(key).encode('utf-8')).hexdigest()}"
+
+    def get(self, key):
+        return self.backend.get_many([self._key(key)]).get(self._key(key))
+
+    def get_many(self, keys: list) -> dict:
+        cache_keys = {self._key(key): key for key in keys}
+        return {cache_keys[cache_key]: value for cache_key, value in self.backend.get_many(list(cache_keys)).items()}
+
+    def set(self, key, value, ttl: int = None):
+        self.backend.set(self._key(key), value, ttl or self.ttl)
+
+    def delete(self, key):
+        self.backend.delete(self._key(key))
+
+
+class MicroCache:
+    """Кэш процесса на доли секунды для ответов, которые в пике запрашивают много раз подряд.
+
+    discard(predicate) удаляет подходящие записи и увеличивает поколение: значение, вычисление
+    которого началось до этого (set с прежним поколением), уже не сохраняется.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[0]
+
+    def set(self, key, value, generation: int):
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, predicate):
+        with self._lock:
+            self.generation += 1
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+
+class SingleFlight:
+    """Одновременные вычисления с одинаковым ключом выполняются один раз в процессе:
+    первый вызов считает, остальные ждут и получают его результат (или его исключение)"""
+
+    class Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self.Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def forget(self, predicate):
+        """Следующие вызовы с подходящими ключами не присоединяются к уже идущим вычислениям"""
+        with self._lock:
+            for key in [key for key in self._calls if predicate(key)]:
+                del self._calls[key]
+
+
+class Cache:
+    def __init__(self, backend, prefix: str = 'parking'):
+        self.backend = backend
+        self.prefix = prefix
+
+    def namespace(self, name: str, ttl: int = None) -> CacheNamespace:
+        return CacheNamespace(self.backend, self.prefix, name, ttl)
+
+    def after_fork(self):
+        """Вызывается в дочернем процессе после fork (см. gunicorn.conf.py)"""
+        self.backend.after_fork()
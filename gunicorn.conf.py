@@ -0,0 +1,93 @@
+"""Конфигурация gunicorn для рабочего режима. Запуск из каталога проекта:
+
+    gunicorn main:app
+
+gunicorn подхватывает этот файл сам. По умолчанию воркеры gevent: пока один запрос ждет
+PostgreSQL или кэш, процесс обслуживает другие, так что маршруты, которые в основном ждут БД
+(/schedule, /get_available_places), получают до GUNICORN_WORKER_CONNECTIONS одновременных
+запросов на процесс. Нужен пакет gevent; GUNICORN_WORKER_CLASS=sync возвращает обычные воркеры.
+
+Переменные окружения:
+    GUNICORN_BIND                 адрес (0.0.0.0:8000)
+    GUNICORN_WORKER_CLASS         gevent (по умолчанию), sync или gthread
+    GUNICORN_WORKERS              число процессов (gevent - по числу ядер, иначе 2 * ядра + 1)
+    GUNICORN_WORKER_CONNECTIONS   одновременных запросов на процесс gevent (100)
+    GUNICORN_MAX_REQUESTS         перезапуск воркера после стольких запросов (1000, 0 - без перезапуска)
+    GUNICORN_TIMEOUT              секунд до перезапуска зависшего воркера (30)
+
+Каждый процесс держит до DB_POOL_SIZE + DB_MAX_OVERFLOW соединений с каждой БД (см. main.py),
+остальные запросы процесса ждут свободного соединения. Сумма по всем процессам не должна
+превышать max_connections PostgreSQL. С gevent лучше CACHE_URL=redis://...: клиент Redis
+работает через кооперативные сокеты, а обращения к SQLite-кэшу блокируют процесс.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+if worker_class == 'gevent':
+    workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+else:
+    workers = int(os.environ.get('GUNICORN_WORKERS', 2 * multiprocessing.cpu_count() + 1))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 100))
+
+# Перезапуск воркеров по числу запросов ограничивает рост памяти процесса (кэши в памяти,
+# фрагментация); разброс не дает всем воркерам перезапуститься одновременно
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = 30
+keepalive = 5
+
+# Приложение загружается один раз в мастере, воркеры получают его при fork: быстрее старт
+# и перезапуск воркеров, а общие страницы памяти не копируются
+preload_app = True
+
+accesslog = '-'
+errorlog = '-'
+
+
+def make_psycopg_green():
+    """psycopg2 ждет ответа БД через цикл событий gevent вместо блокирующего вызова libpq.
+
+    При зарегистрированном wait callback psycopg2 не выполняет COPY, поэтому команды
+    flask import и flask partitions archive запускаются как обычно, без gunicorn
+    """
+    import psycopg2
+    from psycopg2 import extensions
+    from gevent.socket import wait_read, wait_write
+
+    def wait_callback(connection, timeout=None):
+        while True:
+            state = connection.poll()
+            if state == extensions.POLL_OK:
+                break
+            elif state == extensions.POLL_READ:
+                wait_read(connection.fileno(), timeout=timeout)
+            elif state == extensions.POLL_WRITE:
+                wait_write(connection.fileno(), timeout=timeout)
+            else:
+                raise psycopg2.OperationalError(f"Неизвестное состояние соединения: {state}")
+
+    extensions.set_wait_callback(wait_callback)
+
+
+if worker_class == 'gevent':
+    try:
+        from gevent import monkey
+    except ImportError:
+        raise RuntimeError('Для GUNICORN_WORKER_CLASS=gevent нужен пакет gevent')
+    # До загрузки приложения (preload_app): потоки, блокировки и сокеты, которые main.py создает
+    # при импорте, должны быть уже кооперативными
+    monkey.patch_all()
+    make_psycopg_green()
+
+
+def post_fork(server, worker):
+    # Соединения, открытые мастером при загрузке приложения, не должны использоваться
+    # несколькими процессами: каждый воркер открывает свои
+    from main import app, cache, db
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    cache.after_fork()
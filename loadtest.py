@@ -0,0 +1,280 @@
+"""Нагрузочный тест: наплыв пользователей в момент открытия нового дня для бронирования.
+
+Каждый виртуальный пользователь проходит сценарий как в браузере: вход, дашборд,
+проверка свободных мест на последний доступный день (горизонт 30 дней), бронирование
+случайного свободного места и просмотр расписания. По каждому маршруту выводятся
+перцентили задержки p50/p95/p99, доля ошибок и конфликтов и пропускная способность.
+
+Запускать против локального приложения с отдельной (не рабочей) базой - сценарий создает брони:
+
+    python loadtest.py --url http://127.0.0.1:5000 --users 50 --duration 60 --register
+
+Пользователи loadtest-0 ... loadtest-N создаются через /register (флаг --register)
+или заранее командой flask import users.
+"""
+import argparse
+import base64
+import http.client
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urlparse
+
+# Должно совпадать с BOOKING_HORIZON в main.py
+BOOKING_HORIZON = timedelta(days=30)
+LOCATION_OPTION = re.compile(r'<option value="([^"]+)"')
+ENDPOINTS = ['login', 'dashboard', 'get_available_places', 'book', 'schedule']
+
+
+class Client:
+    """HTTP-клиент одного виртуального пользователя: постоянное соединение и cookie сессии"""
+
+    def __init__(self, url: str, timeout: float):
+        parsed = urlparse(url)
+        connection_class = http.client.HTTPSConnection if parsed.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(parsed.hostname, parsed.port, timeout=timeout)
+        self.prefix = parsed.path.rstrip('/')
+        self.cookies = {}
+
+    def request(self, method: str, path: str, body=None, headers=None):
+        headers = dict(headers or {})
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f"{name}={value}" for name, value in self.cookies.items())
+        try:
+            self.connection.request(method, self.prefix + path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            # Соединение могли закрыть между запросами: следующий запрос откроет новое
+            self.connection.close()
+            raise
+        for header in response.headers.get_all('Set-Cookie') or []:
+            for name, morsel in SimpleCookie(header).items():
+                self.cookies[name] = morsel.value
+        return response.status, data
+
+    def flashes(self) -> list:
+        """Сообщения flash из cookie сессии Flask (подпись не проверяется, только чтение)"""
+        value = self.cookies.get('session', '').strip('"')
+        if not value:
+            return []
+        compressed = value.startswith('.')
+        payload = value.lstrip('.').split('.')[0]
+        try:
+            data = base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4))
+            if compressed:
+                data = zlib.decompress(data)
+            flashes = json.loads(data).get('_flashes', [])
+        except (ValueError, zlib.error):
+            return []
+        # Кортежи (категория, сообщение) сериализуются как {" t": [...]}
+        return [tuple(item[' t']) if isinstance(item, dict) else tuple(item) for item in flashes]
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.outcomes = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float, error: bool = False):
+        with self._lock:
+            self.latencies[endpoint].append(seconds)
+            if error:
+                self.errors[endpoint] += 1
+
+    def outcome(self, name: str):
+        with self._lock:
+            self.outcomes[name] += 1
+
+
+def percentile(sorted_values: list, percent: float) -> float:
+    # Метод ближайшего ранга
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def booking_window_date(start_time: str) -> str:
+    """Последний день, на который бронирование уже открыто при заданном времени начала"""
+    limit = datetime.now() + BOOKING_HORIZON
+    day = limit.date()
+    if datetime.fromisoformat(f"{day.isoformat()}T{start_time}") > limit:
+        day -= timedelta(days=1)
+    return day.isoformat()
+
+
+class VirtualUser(threading.Thread):
+    def __init__(self, number: int, args, stats: Stats, stop_at: float, start_delay: float):
+        super().__init__(daemon=True)
+        self.username = f"{args.user_prefix}-{number}"
+        self.args = args
+        self.stats = stats
+        self.stop_at = stop_at
+        self.start_delay = start_delay
+        self.client = Client(args.url, args.timeout)
+        self.locations = args.location or []
+
+    def timed(self, endpoint: str, method: str, path: str, body=None, headers=None, ok=(200,)):
+        started = time.perf_counter()
+        try:
+            status, data = self.client.request(method, path, body, headers)
+        except (OSError, http.client.HTTPException):
+            self.stats.record(endpoint, time.perf_counter() - started, error=True)
+            return None, None
+        self.stats.record(endpoint, time.perf_counter() - started, error=status not in ok)
+        return status, data
+
+    def register(self):
+        form = {'username': self.username, 'password': self.args.password,
+                'confirm_password': self.args.password, 'codeword': self.args.codeword}
+        try:
+            self.client.request('POST', '/register', urlencode(form),
+                                {'Content-Type': 'application/x-www-form-urlencoded'})
+        except (OSError, http.client.HTTPException):
+            pass
+
+    def login(self) -> bool:
+        form = urlencode({'username': self.username, 'password': self.args.password})
+        status, _ = self.timed('login', 'POST', '/login', form,
+                               {'Content-Type': 'application/x-www-form-urlencoded'}, ok=(302,))
+        return status == 302
+
+    def scenario(self):
+        status, data = self.timed('dashboard', 'GET', '/dashboard')
+        if status != 200:
+            return
+        if not self.locations:
+            self.locations = LOCATION_OPTION.findall(data.decode('utf-8', 'replace'))
+            if not self.locations:
+                self.stats.outcome('no_locations')
+                return
+
+        location = random.choice(self.locations)
+        request_body = json.dumps({'location': location, 'dates': [self.args.date],
+                                   'start_time': self.args.start_time, 'end_time': self.args.end_time})
+        status, data = self.timed('get_available_places', 'POST', '/get_available_places', request_body,
+                                  {'Content-Type': 'application/json'})
+        if status != 200:
+            return
+        free = [place for place in json.loads(data)['available_places'] if place['available']]
+        if not free:
+            self.stats.outcome('sold_out')
+        else:
+            # Все выбирают из одного и того же списка - отсюда конфликты в час пик
+            form = urlencode({'place_id': random.choice(free)['id'], 'dates': self.args.date,
+                              'start_time': self.args.start_time, 'end_time': self.args.end_time})
+            status, _ = self.timed('book', 'POST', '/book', form,
+                                   {'Content-Type': 'application/x-www-form-urlencoded'}, ok=(302,))
+            if status == 302:
+                categories = {category for category, message in self.client.flashes()}
+                if 'error' in categories:
+                    self.stats.outcome('conflict')
+                else:
+                    self.stats.outcome('booked')
+            # Сообщения flash забирает следующая страница, как в браузере
+            self.timed('dashboard', 'GET', '/dashboard')
+
+        self.timed('schedule', 'GET', '/schedule?' + urlencode({'location': location}))
+
+    def run(self):
+        time.sleep(self.start_delay)
+        if self.args.register:
+            self.register()
+        if not self.login():
+            self.stats.outcome('login_failed')
+            return
+        iterations = 0
+        while time.monotonic() < self.stop_at and (not self.args.iterations or iterations < self.args.iterations):
+            self.scenario()
+            iterations += 1
+            if self.args.think_time:
+                time.sleep(random.uniform(0, self.args.think_time))
+        self.stats.outcome('completed')
+
+
+def report(stats: Stats, elapsed: float) -> dict:
+    result = {'elapsed': round(elapsed, 2), 'outcomes': dict(stats.outcomes), 'endpoints': {}}
+    for endpoint in ENDPOINTS:
+        latencies = sorted(stats.latencies.get(endpoint, []))
+        if not latencies:
+            continue
+        result['endpoints'][endpoint] = {
+            'requests': len(latencies),
+            'errors': stats.errors.get(endpoint, 0),
+            'error_rate': round(stats.errors.get(endpoint, 0) / len(latencies), 4),
+            'rps': round(len(latencies) / elapsed, 2),
+            'p50_ms': round(percentile(latencies, 50) * 1000, 1),
+            'p95_ms': round(percentile(latencies, 95) * 1000, 1),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 1),
+        }
+    book = result['endpoints'].get('book')
+    if book:
+        book['conflict_rate'] = round(stats.outcomes.get('conflict', 0) / book['requests'], 4)
+    return result
+
+
+def print_report(result: dict):
+    print(f"Длительность: {result['elapsed']} с")
+    print(f"{'маршрут':<22}{'запросов':>9}{'rps':>9}{'p50, мс':>10}{'p95, мс':>10}{'p99, мс':>10}"
+          f"{'ошибки':>9}{'конфликты':>11}")
+    for endpoint, row in result['endpoints'].items():
+        conflicts = f"{row['conflict_rate']:.1%}" if 'conflict_rate' in row else '-'
+        print(f"{endpoint:<22}{row['requests']:>9}{row['rps']:>9}{row['p50_ms']:>10}{row['p95_ms']:>10}"
+              f"{row['p99_ms']:>10}{row['error_rate']:>9.1%}{conflicts:>11}")
+    total = sum(row['requests'] for row in result['endpoints'].values())
+    print(f"Всего: {total} запросов, {total / result['elapsed']:.1f} в секунду")
+    print('Исходы: ' + ', '.join(f"{name}={count}" for name, count in sorted(result['outcomes'].items())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Нагрузочный тест открытия нового дня для бронирования')
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='Адрес запущенного приложения')
+    parser.add_argument('--users', type=int, default=50, help='Число одновременных пользователей')
+    parser.add_argument('--duration', type=float, default=60, help='Длительность теста, секунд')
+    parser.add_argument('--iterations', type=int, default=0, help='Сценариев на пользователя (0 - без ограничения)')
+    parser.add_argument('--ramp-up', type=float, default=0,
+                        help='За сколько секунд подключаются все пользователи (0 - одновременно, как в час пик)')
+    parser.add_argument('--think-time', type=float, default=0, help='Пауза между сценариями, до N секунд')
+    parser.add_argument('--location', action='append', help='Локация (можно несколько); по умолчанию все с дашборда')
+    parser.add_argument('--date', help='Дата бронирования; по умолчанию последний открытый день')
+    parser.add_argument('--start-time', default='09:00')
+    parser.add_argument('--end-time', default='18:00')
+    parser.add_argument('--user-prefix', default='loadtest')
+    parser.add_argument('--password', default='loadtest')
+    parser.add_argument('--register', action='store_true', help='Зарегистрировать пользователей перед входом')
+    parser.add_argument('--codeword', default='парковка', help='Кодовое слово для регистрации')
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--json', action='store_true', help='Вывести результат в JSON')
+    args = parser.parse_args()
+    args.date = args.date or booking_window_date(args.start_time)
+
+    stats = Stats()
+    started = time.monotonic()
+    stop_at = started + args.ramp_up + args.duration
+    users = [VirtualUser(number, args, stats, stop_at, args.ramp_up * number / max(args.users, 1))
+             for number in range(args.users)]
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+
+    result = report(stats, time.monotonic() - started)
+    result['date'] = args.date
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print(f"Дата бронирования: {args.date}, {args.start_time}-{args.end_time}")
+        print_report(result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""Объединяемые скетчи для приближенной аналитики.
+
+HyperLogLog оценивает число различных значений (пользователей) по фиксированному набору
+регистров, SampleCounts - суммы по выборке вместе с дисперсией оценки, Reservoir - равномерная
+выборка фиксированного размера из потока. Скетчи за разные месяцы объединяются без исходных
+строк, поэтому период любой длины собирается из нескольких заранее посчитанных скетчей.
+"""
+import hashlib
+import math
+import random
+
+# Квантиль нормального распределения для 95% доверительного интервала
+Z_95 = 1.96
+
+
+class HyperLogLog:
+    """Оценка числа различных значений по 2**precision однобайтовым регистрам.
+
+    Относительная стандартная ошибка - 1.04 / sqrt(2**precision) (1.6% при precision=12).
+    Объединение скетчей - поэлементный максимум регистров, результат тот же,
+    что у скетча, построенного по объединению значений.
+    """
+
+    def __init__(self, precision: int = 12, registers: bytes = None):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(registers) if registers is not None else bytearray(self.size)
+
+    def add(self, value):
+        digest = int.from_bytes(hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest(), 'big')
+        index = digest >> (64 - self.precision)
+        rest = digest & ((1 << (64 - self.precision)) - 1)
+        # Позиция первой единицы в оставшихся битах
+        rank = 64 - self.precision - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: 'HyperLogLog'):
+        if other.precision != self.precision:
+            raise ValueError('Нельзя объединить HyperLogLog с разной точностью')
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> float:
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        estimate = alpha * self.size * self.size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            # Малые значения: линейный подсчет по пустым регистрам точнее
+            return self.size * math.log(self.size / zeros)
+        return estimate
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(self.size)
+
+    def error(self, z: float = Z_95) -> float:
+        """Полуширина доверительного интервала для count()"""
+        return z * self.relative_error * self.count()
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'HyperLogLog':
+        return cls(len(data).bit_length() - 1, data)
+
+
+class SampleCounts:
+    """Оценки сумм по выборке (оценка Хорвица-Томпсона) вместе с их дисперсией.
+
+    Строка, попавшая в выборку с вероятностью rate, добавляет value / rate к оценке
+    и value**2 * (1 - rate) / rate**2 к дисперсии (формула бернуллиевской выборки;
+    для выборки фиксированного размера она дает верхнюю границу). Оценки и дисперсии
+    независимых выборок складываются, точные значения добавляются с rate=1 и нулевой дисперсией.
+
+    Категория, не попавшая в выборку, получает нулевую оценку с нулевой дисперсией, поэтому
+    add_sample(rate) отмечает каждую выборку: граница ошибки не меньше дисперсии одной пропущенной строки.
+    """
+
+    def __init__(self, estimates: dict = None, variances: dict = None, unseen: float = 0):
+        self.estimates = dict(estimates or {})
+        self.variances = dict(variances or {})
+        self.unseen = unseen
+
+    def add(self, key: str, value: float = 1, rate: float = 1.0):
+        self.estimates[key] = self.estimates.get(key, 0) + value / rate
+        if rate < 1:
+            self.variances[key] = self.variances.get(key, 0) + value * value * (1 - rate) / (rate * rate)
+
+    def add_sample(self, rate: float):
+        if rate < 1:
+            self.unseen += (1 - rate) / (rate * rate)
+
+    def merge(self, other: 'SampleCounts'):
+        for key, value in other.estimates.items():
+            self.estimates[key] = self.estimates.get(key, 0) + value
+        for key, value in other.variances.items():
+            self.variances[key] = self.variances.get(key, 0) + value
+        self.unseen += other.unseen
+
+    def estimate(self, key: str) -> float:
+        return self.estimates.get(key, 0)
+
+    def error(self, key: str, z: float = Z_95) -> float:
+        """Полуширина доверительного интервала для estimate(key)"""
+        return z * math.sqrt(max(self.variances.get(key, 0), self.unseen))
+
+    def to_dict(self) -> dict:
+        return {'estimates': self.estimates, 'variances': self.variances, 'unseen': self.unseen}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SampleCounts':
+        return cls(data.get('estimates'), data.get('variances'), data.get('unseen', 0))
+
+
+class Reservoir:
+    """Равномерная выборка не больше size элементов из потока заранее неизвестной длины (алгоритм R)"""
+
+    def __init__(self, size: int, rng: random.Random = None):
+        self.size = size
+        self.items = []
+        self.seen = 0
+        self._random = rng or random.Random()
+
+    def add(self, item):
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+            return
+        position = self._random.randrange(self.seen)
+        if position < self.size:
+            self.items[position] = item
+
+    @property
+    def rate(self) -> float:
+        """Доля элементов потока, попавших в выборку"""
+        return len(self.items) / self.seen if self.seen else 1.0
@@ -0,0 +1,43 @@
+// Отрисовка компактных графиков аналитики.
+// Спецификация (/analytics/chart-spec.json) кэшируется браузером, с сервера приходят только ряды labels/values.
+function renderAnalyticsCharts(dataUrl) {
+    const specRequest = fetch('/analytics/chart-spec.json').then(response => response.json());
+    const dataRequest = fetch(dataUrl).then(response => response.json());
+
+    return Promise.all([specRequest, dataRequest]).then(([spec, data]) => {
+        if (data.error) {
+            console.error('Error:', data.error);
+            return;
+        }
+
+        Object.keys(spec.charts).forEach(name => {
+            const element = document.getElementById('chart-' + name);
+            const series = data.charts[name];
+            if (!element) {
+                return;
+            }
+            if (!series) {
+                element.innerHTML = '<p class="text-center text-muted py-5">Нет данных за выбранный период</p>';
+                return;
+            }
+
+            const chartSpec = spec.charts[name];
+            const trace = Object.assign({}, chartSpec.trace);
+            if (trace.type === 'pie') {
+                trace.labels = series.labels;
+                trace.values = series.values;
+            } else {
+                trace.x = series.labels;
+                trace.y = series.values;
+            }
+            Plotly.newPlot(element, [trace], chartSpec.layout, {responsive: true});
+        });
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const container = document.getElementById('analytics-charts');
+    if (container && window.Plotly) {
+        renderAnalyticsCharts(container.dataset.url).catch(error => console.error('Error:', error));
+    }
+});
@@ -0,0 +1,45 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Следующая страница таблицы пользователей по курсору из ответа сервера
+    const moreBtn = document.getElementById('user-stats-more-btn');
+    if (!moreBtn) {
+        return;
+    }
+
+    moreBtn.addEventListener('click', function() {
+        const url = new URL(this.dataset.url, window.location.origin);
+        url.searchParams.set('cursor', this.dataset.cursor);
+        this.disabled = true;
+
+        fetch(url)
+        .then(response => response.json())
+        .then(data => {
+            if (data.error) {
+                console.error('Error:', data.error);
+                return;
+            }
+            const body = document.getElementById('user-stats-body');
+            data.users.forEach(user => {
+                const row = document.createElement('tr');
+                [user.username, user.booking_count, user.total_hours + ' ч', user.avg_duration + ' ч', user.last_booking]
+                    .forEach((value, index) => {
+                        const cell = document.createElement('td');
+                        if (index === 0) {
+                            cell.className = 'fw-bold';
+                        }
+                        cell.textContent = value;
+                        row.appendChild(cell);
+                    });
+                body.appendChild(row);
+            });
+            if (data.next_cursor) {
+                this.dataset.cursor = data.next_cursor;
+            } else {
+                this.remove();
+            }
+        })
+        .catch(error => console.error('Error:', error))
+        .finally(() => {
+            this.disabled = false;
+        });
+    });
+});
@@ -0,0 +1,169 @@
+// Инициализация AOS
+AOS.init({
+    duration: 800,
+    easing: 'ease-out-quad',
+    once: true
+});
+
+// Базовая инициализация времени без ограничений
+document.addEventListener('DOMContentLoaded', function() {
+    const timeInputs = document.querySelectorAll('input[type="time"]');
+    timeInputs.forEach(input => {
+        // Убираем ограничения на шаг, чтобы можно было выбирать любые минуты
+        input.step = 60; // 1 минута - минимальный шаг
+    });
+});
+
+document.addEventListener('DOMContentLoaded', function() {
+    // Инициализация flatpickr
+    flatpickr.localize(flatpickr.l10ns.ru);
+
+    // Функция для форматирования даты в локальном формате
+    window.formatDate = function(date) {
+        const year = date.getFullYear();
+        const month = String(date.getMonth() + 1).padStart(2, '0');
+        const day = String(date.getDate()).padStart(2, '0');
+        return `${year}-${month}-${day}`;
+    }
+
+    // Инициализация календаря для выбора дат
+    const datePicker = document.getElementById('date-picker');
+    if (datePicker) {
+        const today = new Date();
+        const maxDate = new Date();
+        maxDate.setDate(today.getDate() + 30);
+
+        window.fp = flatpickr(datePicker, {
+            mode: "multiple",
+            dateFormat: "Y-m-d",
+            minDate: "today",
+            maxDate: maxDate,
+            locale: "ru",
+            inline: true,
+            showMonths: 1,
+            onChange: function(selectedDates, dateStr, instance) {
+                window.updateSelectedDates(selectedDates);
+            }
+        });
+
+        // Функция для обновления отображения выбранных дат
+        window.updateSelectedDates = function(selectedDates) {
+            const container = document.getElementById('selected-dates');
+            container.innerHTML = '';
+
+            selectedDates.sort((a, b) => a - b).forEach(date => {
+                const dateStr = window.formatDate(date);
+                const formattedDate = new Date(dateStr).toLocaleDateString('ru-RU', {
+                    weekday: 'short',
+                    day: 'numeric',
+                    month: 'short'
+                });
+
+                const badge = document.createElement('span');
+                badge.className = 'badge bg-primary date-badge me-2 mb-2 p-2';
+                badge.innerHTML = `<i class="bi bi-calendar me-1"></i> ${formattedDate}`;
+                container.appendChild(badge);
+            });
+
+            // Обновляем скрытое поле с датами
+            document.getElementById('hidden-dates').value = selectedDates.map(d => window.formatDate(d)).join(',');
+        }
+
+        // Функция для добавления дней недели
+        function addWeekdays(dayOfWeek) {
+            const selectedDates = window.fp.selectedDates || [];
+            const selectedDateSet = new Set(selectedDates.map(d => d.getTime()));
+
+            const today = new Date();
+            const endDate = new Date();
+            endDate.setDate(today.getDate() + 30);
+            const currentDate = new Date(today);
+
+            const datesToAdd = [];
+
+            while (currentDate <= endDate) {
+                if (currentDate.getDay() === dayOfWeek) {
+                    if (!selectedDateSet.has(currentDate.getTime())) {
+                        datesToAdd.push(new Date(currentDate));
+                        selectedDateSet.add(currentDate.getTime());
+                    }
+                }
+                currentDate.setDate(currentDate.getDate() + 1);
+            }
+
+            // Добавляем новые даты
+            const newSelectedDates = [...selectedDates, ...datesToAdd];
+            window.fp.setDate(newSelectedDates);
+
+            // Обновляем отображение
+            window.updateSelectedDates(newSelectedDates);
+        }
+
+        // Добавление кнопок для выбора дней недели
+        document.querySelectorAll('.day-selector').forEach(btn => {
+            btn.addEventListener('click', function() {
+                const dayOfWeek = parseInt(this.dataset.day);
+                addWeekdays(dayOfWeek);
+            });
+        });
+
+        // Кнопка выбора всех рабочих дней
+        document.getElementById('select-workdays').addEventListener('click', function() {
+            const selectedDates = window.fp.selectedDates || [];
+            const selectedDateSet = new Set(selectedDates.map(d => d.getTime()));
+
+            const today = new Date();
+            const endDate = new Date();
+            endDate.setDate(today.getDate() + 30);
+            const currentDate = new Date(today);
+
+            const datesToAdd = [];
+
+            while (currentDate <= endDate) {
+                // 1-5: понедельник-пятница
+                if (currentDate.getDay() >= 1 && currentDate.getDay() <= 5) {
+                    if (!selectedDateSet.has(currentDate.getTime())) {
+                        datesToAdd.push(new Date(currentDate));
+                        selectedDateSet.add(currentDate.getTime());
+                    }
+                }
+                currentDate.setDate(currentDate.getDate() + 1);
+            }
+
+            // Добавляем новые даты
+            const newSelectedDates = [...selectedDates, ...datesToAdd];
+            window.fp.setDate(newSelectedDates);
+
+            // Обновляем отображение
+            window.updateSelectedDates(newSelectedDates);
+        });
+
+        // Кнопка очистки
+        document.getElementById('clear-dates').addEventListener('click', function() {
+            window.fp.clear();
+            // Обновляем отображение
+            window.updateSelectedDates([]);
+        });
+
+        // Инициализация текущих дат
+        window.updateSelectedDates(window.fp.selectedDates);
+    }
+
+    // Автоматическое обновление даты окончания
+    const startDateInput = document.querySelector('input[name="start_date"]');
+    const endDateInput = document.querySelector('input[name="end_date"]');
+
+    if (startDateInput && endDateInput) {
+        startDateInput.addEventListener('change', function() {
+            if (endDateInput.value && new Date(endDateInput.value) < new Date(this.value)) {
+                endDateInput.value = this.value;
+            }
+        });
+    }
+
+    // Инициализация подсказок Bootstrap
+    var tooltipTriggerList = [].slice.call(document.querySelectorAll('[data-bs-toggle="tooltip"]'))
+    var tooltipList = tooltipTriggerList.map(function (tooltipTriggerEl) {
+        return new bootstrap.Tooltip(tooltipTriggerEl)
+    })
+});
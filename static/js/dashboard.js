@@ -0,0 +1,724 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Функция для преобразования строки в число для сортировки
+    function parsePlaceNumber(number) {
+        return parseFloat(number);
+    }
+
+    // Флаг для отслеживания инициализации
+    let isInitialized = false;
+
+    // Функция для нормализации даты (установка времени в 00:00:00)
+    function normalizeDate(date) {
+        const normalized = new Date(date);
+        normalized.setHours(0, 0, 0, 0);
+        return normalized;
+    }
+
+    // Функция для получения timestamp даты
+    function getDateTimestamp(date) {
+        return normalizeDate(date).getTime();
+    }
+
+    // Функция для проверки валидности времени
+    function validateTime() {
+        const startTime = document.getElementById('start-time').value;
+        const endTime = document.getElementById('end-time').value;
+        const validationError = document.getElementById('time-validation-error');
+
+        if (startTime && endTime && startTime >= endTime) {
+            validationError.style.display = 'block';
+            return false;
+        } else {
+            validationError.style.display = 'none';
+            return true;
+        }
+    }
+
+    // Функция для показа ошибки времени с фокусировкой
+    function showTimeError() {
+        const startTimeInput = document.getElementById('start-time');
+        const validationError = document.getElementById('time-validation-error');
+
+        validationError.style.display = 'block';
+        startTimeInput.focus();
+        startTimeInput.scrollIntoView({ behavior: 'smooth', block: 'center' });
+
+        // Показываем всплывающее сообщение
+        showFlashMessage('Время начала не может быть больше времени окончания', 'error');
+    }
+
+    // Функция для сброса выбранного места
+    function resetSelectedPlace() {
+        // Сбрасываем выделение
+        document.querySelectorAll('.place-available').forEach(el => {
+            el.classList.remove('selected');
+        });
+
+        // Очищаем hidden input
+        document.getElementById('selected-place-id').value = '';
+
+        // Деактивируем кнопку бронирования
+        document.getElementById('book-button').disabled = true;
+    }
+
+    // Свободные места по дням (дата -> {free, total}) для выбранной локации и времени
+    let availabilityByDate = {};
+
+    // Подсветка заполненных дней в календаре (хук onDayCreate flatpickr)
+    function markCalendarDay(selectedDates, dateStr, instance, dayElem) {
+        const day = availabilityByDate[window.formatDate(dayElem.dateObj)];
+        if (!day) return;
+
+        if (day.free === 0) {
+            dayElem.classList.add('day-full');
+            dayElem.title = 'Свободных мест нет';
+        } else {
+            dayElem.title = `Свободно мест: ${day.free} из ${day.total}`;
+        }
+    }
+
+    // Загрузка свободных мест на весь горизонт бронирования одним запросом
+    function loadAvailabilityCalendar() {
+        if (!window.fp) return;
+
+        const location = document.getElementById('location-select').value;
+        const startTime = document.getElementById('start-time').value;
+        const endTime = document.getElementById('end-time').value;
+
+        if (!location || !startTime || !endTime || startTime >= endTime) {
+            availabilityByDate = {};
+            window.fp.redraw();
+            return;
+        }
+
+        const params = new URLSearchParams({ location: location, start_time: startTime, end_time: endTime });
+        fetch('/availability_calendar?' + params.toString())
+            .then(response => response.json())
+            .then(data => {
+                // Пока шел запрос, локацию или время могли поменять
+                if (data.error || data.location !== document.getElementById('location-select').value) return;
+
+                availabilityByDate = {};
+                data.days.forEach(day => {
+                    availabilityByDate[day.date] = day;
+                });
+                window.fp.redraw();
+            })
+            .catch(error => {
+                console.error('Error:', error);
+            });
+    }
+
+    // Инициализация валидации времени
+    document.getElementById('start-time').addEventListener('change', function() {
+        validateTime();
+        loadAvailabilityCalendar();
+    });
+    document.getElementById('end-time').addEventListener('change', function() {
+        validateTime();
+        loadAvailabilityCalendar();
+    });
+
+    // Функция для добавления дней недели
+    function addWeekdays(dayOfWeek) {
+        if (!window.fp) {
+            console.error('Flatpickr not initialized');
+            return;
+        }
+
+        // Получаем текущие выбранные даты
+        const currentDates = window.fp.selectedDates.map(d => new Date(d));
+        const currentTimestamps = new Set(currentDates.map(getDateTimestamp));
+
+        const today = new Date();
+        today.setHours(0, 0, 0, 0);
+
+        const maxDate = new Date();
+        maxDate.setDate(today.getDate() + 30);
+        maxDate.setHours(0, 0, 0, 0);
+
+        const datesToAdd = [];
+        const currentDate = new Date(today);
+
+        // Добавляем только уникальные даты
+        while (currentDate <= maxDate) {
+            currentDate.setHours(0, 0, 0, 0);
+
+            if (currentDate.getDay() === dayOfWeek) {
+                const timestamp = getDateTimestamp(currentDate);
+                if (!currentTimestamps.has(timestamp)) {
+                    datesToAdd.push(new Date(currentDate));
+                    currentTimestamps.add(timestamp);
+                }
+            }
+            currentDate.setDate(currentDate.getDate() + 1);
+        }
+
+        // Создаем новый массив дат
+        const newSelectedDates = [...currentDates, ...datesToAdd];
+
+        // Убираем возможные дубликаты
+        const uniqueDates = [];
+        const seenTimestamps = new Set();
+
+        newSelectedDates.forEach(date => {
+            const timestamp = getDateTimestamp(date);
+            if (!seenTimestamps.has(timestamp)) {
+                seenTimestamps.add(timestamp);
+                uniqueDates.push(date);
+            }
+        });
+
+        // Сортируем даты
+        uniqueDates.sort((a, b) => a - b);
+
+        // Обновляем календарь
+        window.fp.setDate(uniqueDates);
+
+        // Обновляем отображение выбранных дат
+        if (window.updateSelectedDates) {
+            window.updateSelectedDates(uniqueDates);
+        }
+
+        // Сбрасываем выбранное место при изменении дат
+        resetSelectedPlace();
+
+        // Автоматически обновляем доступные места, если они уже отображаются
+        autoUpdateAvailablePlaces();
+    }
+
+    // Функция для автоматического обновления доступных мест
+    function autoUpdateAvailablePlaces() {
+        const availablePlacesContainer = document.getElementById('available-places-container');
+        if (availablePlacesContainer.style.display !== 'none') {
+            checkAvailability();
+        }
+    }
+
+    // Инициализация обработчиков
+    function initializeEventHandlers() {
+        if (isInitialized) return;
+
+        // Удаляем старые обработчики
+        const newSelectWorkdays = document.getElementById('select-workdays').cloneNode(true);
+        document.getElementById('select-workdays').parentNode.replaceChild(newSelectWorkdays, document.getElementById('select-workdays'));
+
+        const newClearDates = document.getElementById('clear-dates').cloneNode(true);
+        document.getElementById('clear-dates').parentNode.replaceChild(newClearDates, document.getElementById('clear-dates'));
+
+        // Добавляем обработчики для кнопок дней недели
+        document.querySelectorAll('.day-selector').forEach(btn => {
+            btn.addEventListener('click', function() {
+                const dayOfWeek = parseInt(this.dataset.day);
+                addWeekdays(dayOfWeek);
+            });
+        });
+
+        // Кнопка выбора всех рабочих дней
+        document.getElementById('select-workdays').addEventListener('click', function() {
+            if (!window.fp) return;
+
+            const currentDates = window.fp.selectedDates.map(d => new Date(d));
+            const currentTimestamps = new Set(currentDates.map(getDateTimestamp));
+
+            const today = new Date();
+            today.setHours(0, 0, 0, 0);
+
+            const maxDate = new Date();
+            maxDate.setDate(today.getDate() + 30);
+            maxDate.setHours(0, 0, 0, 0);
+
+            const datesToAdd = [];
+            const currentDate = new Date(today);
+
+            while (currentDate <= maxDate) {
+                currentDate.setHours(0, 0, 0, 0);
+
+                // 1-5: понедельник-пятница
+                if (currentDate.getDay() >= 1 && currentDate.getDay() <= 5) {
+                    const timestamp = getDateTimestamp(currentDate);
+                    if (!currentTimestamps.has(timestamp)) {
+                        datesToAdd.push(new Date(currentDate));
+                        currentTimestamps.add(timestamp);
+                    }
+                }
+                currentDate.setDate(currentDate.getDate() + 1);
+            }
+
+            // Создаем новый массив дат
+            const newSelectedDates = [...currentDates, ...datesToAdd];
+
+            // Убираем возможные дубликаты
+            const uniqueDates = [];
+            const seenTimestamps = new Set();
+
+            newSelectedDates.forEach(date => {
+                const timestamp = getDateTimestamp(date);
+                if (!seenTimestamps.has(timestamp)) {
+                    seenTimestamps.add(timestamp);
+                    uniqueDates.push(date);
+                }
+            });
+
+            // Сортируем даты
+            uniqueDates.sort((a, b) => a - b);
+
+            // Обновляем календарь
+            window.fp.setDate(uniqueDates);
+
+            // Обновляем отображение выбранных дат
+            if (window.updateSelectedDates) {
+                window.updateSelectedDates(uniqueDates);
+            }
+
+            // Сбрасываем выбранное место
+            resetSelectedPlace();
+
+            // Автоматически обновляем доступные места
+            autoUpdateAvailablePlaces();
+        });
+
+        // Кнопка очистки
+        document.getElementById('clear-dates').addEventListener('click', function() {
+            if (window.fp) {
+                window.fp.clear();
+                if (window.updateSelectedDates) {
+                    window.updateSelectedDates([]);
+                }
+                // Сбрасываем выбранное место
+                resetSelectedPlace();
+                // Автоматически обновляем доступные места
+                autoUpdateAvailablePlaces();
+            }
+        });
+
+        // Сбрасываем чекбокс при изменении локации
+        document.getElementById('location-select').addEventListener('change', function() {
+            document.getElementById('save-as-default').checked = false;
+            // Сбрасываем выбранное место
+            resetSelectedPlace();
+            // Подсвечиваем заполненные дни новой локации
+            loadAvailabilityCalendar();
+            // Автоматически обновляем доступные места, если они уже отображаются
+            autoUpdateAvailablePlaces();
+        });
+
+        isInitialized = true;
+    }
+
+    // Функция для проверки доступности мест
+    function checkAvailability() {
+        // Проверяем валидность времени перед проверкой доступности
+        if (!validateTime()) {
+            showTimeError();
+            return;
+        }
+
+        const location = document.getElementById('location-select').value;
+        const selectedDates = window.fp ? window.fp.selectedDates : [];
+        const startTime = document.getElementById('start-time').value;
+        const endTime = document.getElementById('end-time').value;
+
+        if (!location) {
+            showFlashMessage('Пожалуйста, выберите локацию', 'error');
+            return;
+        }
+
+        if (selectedDates.length === 0) {
+            showFlashMessage('Пожалуйста, выберите хотя бы одну дату', 'error');
+            return;
+        }
+
+        if (!startTime || !endTime) {
+            showFlashMessage('Пожалуйста, укажите время бронирования', 'error');
+            return;
+        }
+
+        // Получаем название выбранной локации
+        const locationSelect = document.getElementById('location-select');
+        const selectedLocationName = locationSelect.options[locationSelect.selectedIndex].text;
+        document.getElementById('selected-location-name').textContent = selectedLocationName;
+
+        // Форматируем даты для отправки
+        const dates = selectedDates.map(date => window.formatDate(date));
+
+        // Показываем загрузку
+        document.getElementById('available-places').innerHTML =
+            '<div class="text-center w-100 py-4"><div class="spinner-border text-primary" role="status"></div><p class="mt-2">Проверяем доступность...</p></div>';
+        document.getElementById('available-places-container').style.display = 'block';
+
+        // Обновляем информацию о выбранном времени
+        const startTimeFormatted = new Date(`2000-01-01T${startTime}`).toLocaleTimeString('ru-RU', {
+            hour: '2-digit', minute: '2-digit'
+        });
+        const endTimeFormatted = new Date(`2000-01-01T${endTime}`).toLocaleTimeString('ru-RU', {
+            hour: '2-digit', minute: '2-digit'
+        });
+        document.getElementById('selected-time-range').textContent =
+            `${startTimeFormatted} - ${endTimeFormatted}`;
+
+        // Отправляем запрос на сервер
+        fetch('/get_available_places', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                location: location,
+                dates: dates,
+                start_time: startTime,
+                end_time: endTime
+            })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.error) {
+                showFlashMessage('Ошибка: ' + data.error, 'error');
+                return;
+            }
+
+            displayAvailablePlaces(data.available_places || []);
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            showFlashMessage('Произошла ошибка при проверке доступности мест', 'error');
+        });
+    }
+
+    // Функция для отображения доступных мест
+    function displayAvailablePlaces(places) {
+        const container = document.getElementById('available-places');
+        container.innerHTML = '';
+
+        if (!places.some(place => place.available)) {
+            container.innerHTML = '<div class="alert alert-warning w-100">Нет доступных мест на выбранные даты ' +
+                '<button type="button" class="btn btn-sm btn-warning ms-2" id="join-waitlist-btn">Встать в лист ожидания</button></div>';
+            document.getElementById('join-waitlist-btn').addEventListener('click', joinWaitlist);
+            if (places.length === 0) {
+                return;
+            }
+        }
+
+        // Сортируем места по номеру (преобразуя строки в числа для правильной сортировки)
+        places.sort((a, b) => parsePlaceNumber(a.number) - parsePlaceNumber(b.number));
+
+        // Создаем элементы для каждого места из ответа сервера
+        places.forEach(placeInfo => {
+            const placeElement = document.createElement('div');
+            placeElement.className = `place ${placeInfo.available ? 'place-available' : 'place-unavailable'}`;
+            placeElement.textContent = placeInfo.number;
+
+            if (placeInfo.available) {
+                placeElement.dataset.placeId = placeInfo.id;
+                placeElement.addEventListener('click', function() {
+                    selectPlace(placeInfo.id, placeInfo.number);
+                });
+                placeElement.title = 'Нажмите, чтобы выбрать это место';
+            } else {
+                placeElement.title = 'Место занято на выбранные даты';
+            }
+
+            container.appendChild(placeElement);
+        });
+    }
+
+    // Постановка в лист ожидания: место будет забронировано автоматически, когда освободится
+    function joinWaitlist() {
+        const selectedDates = window.fp ? window.fp.selectedDates : [];
+        fetch('/waitlist', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                location: document.getElementById('location-select').value,
+                dates: selectedDates.map(date => window.formatDate(date)),
+                start_time: document.getElementById('start-time').value,
+                end_time: document.getElementById('end-time').value,
+                auto_book: true
+            })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.error) {
+                showFlashMessage('Ошибка: ' + data.error, 'error');
+                return;
+            }
+            data.results.forEach(result => {
+                showFlashMessage(result.message, result.type === 'success' ? 'success' : 'danger');
+            });
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            showFlashMessage('Произошла ошибка при постановке в лист ожидания', 'error');
+        });
+    }
+
+    // Функция выбора места
+    function selectPlace(placeId, placeNumber) {
+        // Сбрасываем предыдущее выделение
+        document.querySelectorAll('.place-available').forEach(el => {
+            el.classList.remove('selected');
+        });
+
+        // Выделяем выбранное место
+        const selectedElement = document.querySelector(`.place[data-place-id="${placeId}"]`);
+        if (selectedElement) {
+            selectedElement.classList.add('selected');
+        }
+
+        // Устанавливаем значение в hidden input
+        document.getElementById('selected-place-id').value = placeId;
+
+        // Активируем кнопку бронирования
+        document.getElementById('book-button').disabled = false;
+
+        // Плавно прокручиваем к кнопке бронирования
+        document.getElementById('book-button').scrollIntoView({
+            behavior: 'smooth',
+            block: 'center'
+        });
+    }
+
+    // Функция для показа всплывающих сообщений
+    function showFlashMessage(message, type) {
+        // Создаем элемент уведомления
+        const alertDiv = document.createElement('div');
+        alertDiv.className = `alert alert-${type} alert-dismissible fade show`;
+        alertDiv.style.cssText = 'position: fixed; top: 20px; right: 20px; z-index: 1060; min-width: 300px;';
+        alertDiv.innerHTML = `
+            <i class="bi bi-${type === 'success' ? 'check-circle' : 'exclamation-circle'} me-2"></i>
+            ${message}
+            <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
+        `;
+
+        // Добавляем в body
+        document.body.appendChild(alertDiv);
+
+        // Автоматически закрываем через 5 секунд
+        setTimeout(() => {
+            if (alertDiv.parentNode) {
+                alertDiv.remove();
+            }
+        }, 5000);
+    }
+
+    // Обработчик для чекбокса "Использовать как локацию по умолчанию"
+    document.getElementById('save-as-default').addEventListener('change', function() {
+        const location = document.getElementById('location-select').value;
+        const saveAsDefault = this.checked;
+
+        if (saveAsDefault && !location) {
+            showFlashMessage('Пожалуйста, выберите локацию для сохранения', 'warning');
+            this.checked = false;
+            return;
+        }
+
+        // Отправляем запрос на сервер
+        fetch('/save_default_location', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                location: location,
+                save_as_default: saveAsDefault
+            })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                showFlashMessage(data.message, 'success');
+            } else {
+                showFlashMessage(data.error, 'error');
+                this.checked = !saveAsDefault; // Возвращаем предыдущее состояние
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            showFlashMessage('Произошла ошибка при сохранении локации', 'error');
+            this.checked = !saveAsDefault; // Возвращаем предыдущее состояние
+        });
+    });
+
+    // Обработчик отправки формы бронирования
+    document.getElementById('booking-form').addEventListener('submit', function(e) {
+        // Проверяем валидность времени перед отправкой
+        if (!validateTime()) {
+            e.preventDefault();
+            showTimeError();
+            return;
+        }
+
+        // Проверяем, что место выбрано
+        const selectedPlaceId = document.getElementById('selected-place-id').value;
+        if (!selectedPlaceId) {
+            e.preventDefault();
+            showFlashMessage('Пожалуйста, выберите место для бронирования', 'error');
+            return;
+        }
+
+        // Проверяем, что есть выбранные даты
+        const selectedDates = window.fp ? window.fp.selectedDates : [];
+        if (selectedDates.length === 0) {
+            e.preventDefault();
+            showFlashMessage('Пожалуйста, выберите хотя бы одну дату', 'error');
+            return;
+        }
+
+        // Повторяющаяся бронь: дни недели берем из выбранных дат (0 - понедельник)
+        if (document.getElementById('repeat-weekly').checked) {
+            const weekdays = new Set(selectedDates.map(date => (date.getDay() + 6) % 7));
+            const firstDate = selectedDates.reduce((a, b) => (a < b ? a : b));
+            document.getElementById('series-weekdays').value = Array.from(weekdays).join(',');
+            document.getElementById('series-start-date').value = window.formatDate(firstDate);
+            this.action = this.dataset.seriesAction;
+        } else {
+            this.action = this.dataset.bookAction;
+        }
+    });
+
+    document.getElementById('repeat-weekly').addEventListener('change', function() {
+        document.getElementById('series-end-container').style.display = this.checked ? 'flex' : 'none';
+    });
+
+    // Инициализация после загрузки flatpickr
+    function initAfterFlatpickr() {
+        if (window.fp && typeof window.updateSelectedDates === 'function') {
+            // Переопределяем функцию updateSelectedDates для автоматического обновления и сброса выбранного места
+            const originalUpdateSelectedDates = window.updateSelectedDates;
+            window.updateSelectedDates = function(selectedDates) {
+                originalUpdateSelectedDates(selectedDates);
+                // Сбрасываем выбранное место при изменении дат
+                resetSelectedPlace();
+                autoUpdateAvailablePlaces();
+            };
+
+            initializeEventHandlers();
+
+            window.fp.config.onDayCreate.push(markCalendarDay);
+            loadAvailabilityCalendar();
+        } else {
+            // Если flatpickr еще не загрузился, ждем
+            setTimeout(initAfterFlatpickr, 100);
+        }
+    }
+
+    // Запускаем инициализацию
+    initAfterFlatpickr();
+
+    // Назначаем обработчик на кнопку проверки доступности
+    document.getElementById('check-availability-btn').addEventListener('click', checkAvailability);
+
+    // Автоподбор места: сервер сам выбирает место, свободное на все даты
+    document.getElementById('auto-book-btn').addEventListener('click', function() {
+        if (!validateTime()) {
+            showTimeError();
+            return;
+        }
+
+        const location = document.getElementById('location-select').value;
+        const selectedDates = window.fp ? window.fp.selectedDates : [];
+        if (!location || selectedDates.length === 0) {
+            showFlashMessage('Пожалуйста, выберите локацию и хотя бы одну дату', 'error');
+            return;
+        }
+
+        fetch('/auto_book', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                location: location,
+                dates: selectedDates.map(date => window.formatDate(date)),
+                start_time: document.getElementById('start-time').value,
+                end_time: document.getElementById('end-time').value
+            })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.error) {
+                showFlashMessage('Ошибка: ' + data.error, 'error');
+                return;
+            }
+            data.results.forEach(result => {
+                showFlashMessage(result.message, result.type === 'success' ? 'success' : 'danger');
+            });
+            if (data.assignments.length > 0) {
+                setTimeout(() => window.location.reload(), 1500);
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            showFlashMessage('Произошла ошибка при подборе места', 'error');
+        });
+    });
+
+    // Следующая страница броней: курсор из ответа сервера указывает, с какой брони продолжить
+    const bookingsMoreBtn = document.getElementById('bookings-more-btn');
+    if (bookingsMoreBtn) {
+        bookingsMoreBtn.addEventListener('click', function() {
+            const url = new URL(this.dataset.url, window.location.origin);
+            url.searchParams.set('cursor', this.dataset.cursor);
+            this.disabled = true;
+
+            fetch(url)
+            .then(response => response.json())
+            .then(data => {
+                if (data.error) {
+                    showFlashMessage('Ошибка: ' + data.error, 'error');
+                    return;
+                }
+                const list = document.getElementById('bookings-list');
+                data.bookings.forEach(booking => list.appendChild(createBookingCard(booking)));
+                if (data.next_cursor) {
+                    this.dataset.cursor = data.next_cursor;
+                } else {
+                    this.remove();
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                showFlashMessage('Не удалось загрузить бронирования', 'error');
+            })
+            .finally(() => {
+                this.disabled = false;
+            });
+        });
+    }
+
+    // Карточка брони, как в шаблоне dashboard.html
+    function createBookingCard(booking) {
+        const [startDate, startTime] = booking.start.split('T');
+        const endTime = booking.end.split('T')[1];
+        const card = document.createElement('div');
+        card.className = 'booking-card';
+        card.innerHTML = `
+            <div class="d-flex justify-content-between align-items-start mb-2">
+                <div class="flex-grow-1">
+                    <h5 class="mb-1"><i class="bi bi-geo-alt me-2"></i>Место <span class="booking-place"></span></h5>
+                    <span class="text-muted small">
+                        <i class="bi bi-building me-1"></i><span class="booking-location"></span>
+                    </span>
+                    <div class="mt-2">
+                        <span class="fw-bold text-primary fs-6">${startDate.split('-').reverse().join('.')}</span>
+                        <div class="booking-time">
+                            <i class="bi bi-clock"></i>
+                            <span>${startTime.slice(0, 5)} - ${endTime.slice(0, 5)}</span>
+                        </div>
+                    </div>
+                </div>
+                <a class="btn btn-sm btn-outline-danger ms-2" style="white-space: nowrap;">
+                    <i class="bi bi-x-circle"></i> Отменить
+                </a>
+            </div>`;
+        card.querySelector('.booking-place').textContent = booking.place;
+        card.querySelector('.booking-location').textContent = booking.location;
+        card.querySelector('a').href = booking.cancel_url;
+        return card;
+    }
+
+    // Инициализируем валидацию времени при загрузке
+    validateTime();
+});